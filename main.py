@@ -1,6 +1,10 @@
+import sqlite3
 import tempfile
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 from src.base_model import Model
 
@@ -13,15 +17,50 @@ class User(Model):
 
     class Meta:
         db_table = "users"
+        indexes = ("email",)
 
 
-def test_basic_orm():
+class Admin(User):
+    """Наследник без собственного db_table: работает с таблицей users."""
+
+
+class AuditLog(Model):
+    message: str
+
+    class Meta:
+        db_table = "audit_log"
+        cache_size = 0
+
+
+class Measurement(Model):
+    # Строковые аннотации разбираются без typing.get_type_hints
+    label: "str"
+    value: "float | None"
+    verified: "bool"
+
+    class Meta:
+        db_table = "measurements"
+
+
+@contextmanager
+def temp_db(**kwargs: Any) -> Iterator[Path]:
+    """Подключает модели к временной БД и удаляет её файлы (вместе с -wal и -shm) после теста."""
     with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as test_db:
         test_db_path = Path(test_db.name)
 
-    Model.configure_db(test_db_path)
+    Model.configure_db(test_db_path, **kwargs)
 
     try:
+        yield test_db_path
+    finally:
+        # Очистка тестовой БД: подключение закрывается до удаления файлов
+        Model._db.close()
+        for suffix in ("", "-wal", "-shm"):
+            test_db_path.with_name(test_db_path.name + suffix).unlink(missing_ok=True)
+
+
+def test_basic_orm():
+    with temp_db():
         # 1. Создание таблицы
         User.create_table()
 
@@ -55,12 +94,227 @@ def test_basic_orm():
         user1_updated.delete()
         assert User.get(user1_id) is None
 
-        print("All tests passed!")
-    finally:
-        # Очистка тестовой БД
-        if test_db_path.exists():
-            test_db_path.unlink()
+
+def test_auto_create():
+    # 1. configure_db() создает таблицы всех моделей
+    with temp_db():
+        assert User.all() == []
+        assert AuditLog.all() == []
+
+    # 2. С auto_create=False таблицы создаются вручную
+    with temp_db(auto_create=False):
+        try:
+            User.all()
+        except sqlite3.OperationalError:
+            pass
+        else:
+            raise AssertionError("table was created with auto_create=False")
+
+        User.create_table()
+        assert User.all() == []
+
+
+def test_generated_init():
+    # 1. Поля принимаются позиционно и по имени, id - только по имени
+    user = User("Ivan", email="ivan@mail.com", age=30, id=7)
+    assert (user.id, user.name, user.email, user.age) == (7, "Ivan", "ivan@mail.com", 30)
+
+    # 2. Лишние именованные аргументы сохраняются как атрибуты
+    assert User("Judy", "judy@mail.com", nickname="jj").nickname == "jj"
+
+    # 3. Лишние позиционные аргументы отклоняются
+    try:
+        User("Ivan", "ivan@mail.com", 30, "extra")
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("__init__ accepted an extra positional argument")
+
+
+def test_string_annotations():
+    fields = Measurement._meta["fields"]
+    assert (fields["value"]["sqlite_type"], fields["value"]["python_type"]) == ("REAL", float)
+    assert (fields["verified"]["sqlite_type"], fields["verified"]["python_type"]) == ("INTEGER", bool)
+
+    with temp_db():
+        measurement = Measurement("temperature", None, True)
+        measurement.save()
+        fetched = Measurement.get(measurement.id)
+        assert (fetched.label, fetched.value, fetched.verified) == ("temperature", None, True)
+
+
+def test_transactions():
+    with temp_db():
+        # 1. Откат транзакции при исключении
+        try:
+            with Model.transaction():
+                User("Ghost", "ghost@mail.com").save()
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        assert User.all() == []
+
+        # 2. Вложенный блок присоединяется к внешней транзакции: откат внешнего отменяет и его
+        try:
+            with Model.transaction():
+                User("Outer", "outer@mail.com").save()
+                with Model.transaction():
+                    User("Inner", "inner@mail.com").save()
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        assert User.all() == []
+
+        # 3. Успешный блок фиксирует все операции
+        with Model.transaction():
+            User("Grace", "grace@mail.com").save()
+            User("Heidi", "heidi@mail.com").save()
+        assert not Model._db.in_atomic_block
+        assert [user.name for user in User.all()] == ["Grace", "Heidi"]
+
+
+def test_iterators():
+    with temp_db():
+        User.bulk_create([User("Kate", "kate@mail.com", 20), User("Leo", "leo@mail.com", 15)])
+
+        # 1. iter_all() читает строки по одной, не собирая список
+        users = User.iter_all()
+        assert not isinstance(users, list)
+        assert next(users).name == "Kate"
+        assert [user.name for user in users] == ["Leo"]
+
+        # 2. iter_filter() применяет условия так же, как filter()
+        assert [user.name for user in User.iter_filter(age__lt=18)] == ["Leo"]
+
+        # 3. Ошибка в условиях возникает сразу при вызове, а не при первой итерации
+        try:
+            User.iter_filter(nickname="kate")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("iter_filter() accepted an unknown field")
+
+
+def test_bulk_update_and_delete():
+    with temp_db():
+        users = User.bulk_create([User("Carol", "carol@mail.com", 30), User("Dave", "dave@mail.com", 17)])
+        ids = [user.id for user in users]
+
+        # 1. Массовое обновление
+        users[0].age = 31
+        users[1].age = 19
+        User.bulk_update(users)
+        assert [user.age for user in User.filter(age__gt=18)] == [31, 19]
+
+        # 2. Экземпляр без id нельзя обновить
+        try:
+            User.bulk_update([User("Mallory", "mallory@mail.com")])
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("bulk_update() accepted an instance without id")
+
+        # 3. Массовое удаление возвращает количество удаленных записей
+        assert User.bulk_delete([*ids, ids[-1] + 100]) == 2
+        assert User.all() == []
+
+
+def test_values_and_indexes():
+    with temp_db():
+        # 1. Выборка значений колонок без создания экземпляров
+        user = User("Eve", "eve@mail.com", 40)
+        user.save()
+        User("Frank", "frank@mail.com", 50).save()
+        assert User.values("name", "age", age__gt=18) == [("Eve", 40), ("Frank", 50)]
+        assert User.values("id", name="Eve") == [(user.id,)]
+
+        # 2. Meta.indexes создает индекс idx_<таблица>_<поле>
+        cursor = Model._db.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'users'")
+        assert [row[0] for row in cursor] == ["idx_users_email"]
+
+
+def test_bulk_create():
+    with temp_db():
+        # 1. Массовое создание: id присваиваются по порядку
+        users = User.bulk_create([User("Carol", "carol@mail.com", 30), User("Dave", "dave@mail.com", 17)])
+        ids = [user.id for user in users]
+        assert ids[0] is not None
+        assert ids[1] == ids[0] + 1
+        assert [user.name for user in User.all()] == ["Carol", "Dave"]
+
+        # 2. Экземпляр с id не вставляется повторно
+        try:
+            User.bulk_create([users[0]])
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("bulk_create() accepted an instance with id")
+        assert users[0].id == ids[0]
+        assert len(User.all()) == 2
+
+        # 3. Ошибка в одной строке откатывает всю пачку
+        try:
+            User.bulk_create([User("Erin", "erin@mail.com", 20), User("Broken", {"not": "bindable"}, 20)])
+        except sqlite3.Error:
+            pass
+        else:
+            raise AssertionError("bulk_create() accepted an unsupported value")
+        assert len(User.all()) == 2
+
+
+def test_get_cache():
+    with temp_db():
+        # 1. get() возвращает свежие данные после save() (кеш инвалидируется)
+        user = User("Eve", "eve@mail.com", 20)
+        user.save()
+        assert User.get(user.id).age == 20
+        user.age = 40
+        user.save()
+        assert User.get(user.id).age == 40
+
+        # 2. Модели на одной таблице делят кеш: изменения через наследника видны родителю
+        admin = Admin.get(user.id)
+        admin.name = "Eve Admin"
+        admin.save()
+        assert User.get(user.id).name == "Eve Admin"
+
+        Admin.bulk_delete([user.id])
+        assert User.get(user.id) is None
+
+        # 3. Строка, прочитанная из чужой незавершенной транзакции, не кешируется после её отката
+        user = User("Frank", "frank@mail.com", 50)
+        user.save()
+        db = Model._db
+        cache = User._meta["_get_cache"]
+        try:
+            with Model.transaction():
+                user.name = "Draft"
+                user.save()
+                # Так get() другого потока читает строку между инвалидацией и commit
+                snapshot = (cache["generation"], db.rollback_count)
+                row = db.execute(User._meta["sql"]["select_by_id"], (user.id,)).fetchone()
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        User._cache_row(db, row, snapshot)
+        assert User.get(user.id).name == "Frank"
+
+        # 4. Meta.cache_size = 0 отключает кеш
+        entry = AuditLog(message="created")
+        entry.save()
+        assert AuditLog.get(entry.id).message == "created"
+        assert not AuditLog._meta["_get_cache"]["rows"]
 
 
 if __name__ == "__main__":
     test_basic_orm()
+    test_auto_create()
+    test_generated_init()
+    test_string_annotations()
+    test_transactions()
+    test_bulk_update_and_delete()
+    test_bulk_create()
+    test_values_and_indexes()
+    test_iterators()
+    test_get_cache()
+    print("All tests passed!")
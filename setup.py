@@ -0,0 +1,33 @@
+"""
+Сборка ускоренной версии ORM: модули с горячими путями компилируются Cython.
+
+    python setup.py build_ext --inplace
+
+Без установленного Cython ничего не компилируется, и пакет работает как обычный Python код.
+"""
+
+from setuptools import setup
+
+# Модули, которые компилируются (main.py и __init__.py остаются на Python)
+COMPILED_MODULES = [
+    "src/base_model.py",
+    "src/database/field_types.py",
+    "src/database/query.py",
+]
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        COMPILED_MODULES,
+        compiler_directives={
+            "language_level": 3,
+            # Строгие проверки аннотаций Cython отклоняют подклассы встроенных типов
+            # (экземпляры ModelMeta для `type`, кортежи вместо `list`), а C-типов в аннотациях нет
+            "annotation_typing": False,
+        },
+    )
+
+setup(ext_modules=ext_modules, packages=[], py_modules=[])
@@ -1,17 +1,26 @@
 import inspect
+import sys
+import threading
 
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
 from pathlib import Path
-from typing import Any, ClassVar, get_type_hints
+from typing import Any, ClassVar
 
 from src.database.connection import DatabaseConnection
-from src.database.field_types import from_db_value, get_field_type, to_db_value
+from src.database.field_types import get_field_type, resolve_annotation
 from src.database.query import QueryBuilder
 
 
 class ModelMeta(type):
     """Мета-класс для Model, обрабатывающий аннотации и Meta конфигурацию."""
 
-    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any]) -> type:
+    # Кеши get() по именам таблиц: модели на одной таблице (например, наследник без собственного
+    # db_table) делят кеш и видят изменения друг друга
+    _row_caches: ClassVar[dict[str, dict[str, Any]]] = {}
+
+    def __new__(mcs, name: str, bases: tuple[Any, ...], namespace: dict[str, Any]) -> type:
         cls = super().__new__(mcs, name, bases, namespace)
 
         # Обработка Meta класса
@@ -36,6 +45,12 @@ class ModelMeta(type):
         if not hasattr(meta_class, "db_table"):
             meta_class.db_table = None
 
+        if not hasattr(meta_class, "indexes"):
+            meta_class.indexes = ()
+
+        if not hasattr(meta_class, "cache_size"):
+            meta_class.cache_size = 1024
+
         cls.Meta = meta_class
 
         # Пропускаем обработку для абстрактных моделей
@@ -47,7 +62,7 @@ class ModelMeta(type):
             meta_class.db_table = name.lower()
 
         # Парсинг аннотаций полей
-        type_hints = get_type_hints(cls, include_extras=True)
+        type_hints = mcs._collect_annotations(cls)
         fields: dict[str, Any] = {}
 
         for field_name, annotation in type_hints.items():
@@ -66,17 +81,142 @@ class ModelMeta(type):
                     "annotation": annotation,
                     "sqlite_type": field_type.sqlite_type,
                     "python_type": field_type.python_type,
+                    # Преобразование значения из БД (None - значение используется как есть).
+                    # При записи преобразования не нужны: sqlite3 сам сохраняет True/False как 1/0
+                    "from_db": bool if field_type.python_type is bool else None,
                 }
 
+        # Проверяем, что индексируемые поля существуют
+        for field_name in meta_class.indexes:
+            if field_name not in fields and field_name != "id":
+                raise ValueError(f"Index field '{field_name}' does not exist in model {name}")
+
         # Сохраняем метаданные модели
         cls._meta = {
             "table_name": meta_class.db_table,
             "fields": fields,
             "abstract": meta_class.abstract,
+            "sql": mcs._build_sql(meta_class.db_table, tuple(fields), tuple(meta_class.indexes)),
+            # Параллельные кортежи (имена, типы SQLite, from_db) в порядке колонок после id
+            "cols": (
+                tuple(fields),
+                tuple(field_meta["sqlite_type"] for field_meta in fields.values()),
+                tuple(field_meta["from_db"] for field_meta in fields.values()),
+            ),
+            # Таблица уже создана или найдена в текущей БД (сбрасывается в configure_db)
+            "_table_ready": False,
+            # LRU кеш строк для get(), общий для всех моделей таблицы: rows - {id: строка БД}, доступ
+            # только под lock; generation увеличивается при каждой инвалидации, чтобы не сохранить строку,
+            # прочитанную до изменения
+            "cache_size": meta_class.cache_size,
+            "_get_cache": mcs._row_caches.setdefault(
+                meta_class.db_table, {"rows": OrderedDict(), "lock": threading.Lock(), "generation": 0}
+            ),
         }
 
+        # Генерируем __init__ с явными аргументами, если модель не определяет собственный
+        generated_init = "__init__" not in namespace and mcs._uses_default_init(cls)
+        if generated_init:
+            cls.__init__ = mcs._build_init(cls.__qualname__, tuple(fields))
+
+        # Только сгенерированный __init__ можно пропускать при чтении строк из БД
+        cls._meta["generated_init"] = generated_init
+
         return cls
 
+    @staticmethod
+    def _collect_annotations(cls: type) -> dict[str, Any]:
+        """
+        Собирает аннотации полей модели и её родителей без typing.get_type_hints.
+
+        Служебные атрибуты (начинающиеся с "_") пропускаются до разрешения строковых аннотаций.
+
+        Returns:
+            Словарь {имя поля: аннотация} в порядке объявления, начиная с базовых классов
+        """
+        annotations: dict[str, Any] = {}
+
+        for base in reversed(cls.__mro__):
+            base_annotations = inspect.get_annotations(base)
+            if not base_annotations:
+                continue
+
+            module = sys.modules.get(base.__module__)
+            globalns = vars(module) if module is not None else {}
+
+            for field_name, annotation in base_annotations.items():
+                if not field_name.startswith("_"):
+                    annotations[field_name] = resolve_annotation(annotation, globalns, vars(base))
+
+        return annotations
+
+    @staticmethod
+    def _uses_default_init(cls: type) -> bool:
+        """Проверяет, что модель наследует базовый или сгенерированный __init__, а не пользовательский."""
+        init = cls.__init__
+        return init is Model.__init__ or getattr(init, "_generated", False)
+
+    @staticmethod
+    def _build_init(qualname: str, field_names: tuple[str, ...]) -> Any:
+        """
+        Генерирует __init__ для модели: поля принимаются позиционно или по имени, id - только по имени.
+
+        Args:
+            qualname: Полное имя класса модели
+            field_names: Имена полей модели в порядке объявления
+
+        Returns:
+            Функция __init__ без циклов по полям
+        """
+        params = "".join(f"{name}=None, " for name in field_names)
+        lines = [
+            f"def __init__(_self, {params}*, id=None, **_extra):",
+            "    _self.id = id",
+            *(f"    _self.{name} = {name}" for name in field_names),
+            "    for _key, _value in _extra.items():",
+            "        _setattr(_self, _key, _value)",
+        ]
+
+        namespace: dict[str, Any] = {}
+        exec("\n".join(lines), {"_setattr": setattr}, namespace)
+
+        init = namespace["__init__"]
+        init.__qualname__ = f"{qualname}.__init__"
+        init.__doc__ = "Инициализация экземпляра модели."
+        init._generated = True
+        return init
+
+    @staticmethod
+    def _build_sql(table_name: str, field_names: tuple[str, ...], indexes: tuple[str, ...]) -> dict[str, Any]:
+        """
+        Заранее формирует SQL запросы модели, чтобы не собирать их при каждой операции.
+
+        Args:
+            table_name: Имя таблицы
+            field_names: Имена полей модели (без id) в порядке объявления
+            indexes: Имена полей, по которым создаются индексы
+
+        Returns:
+            Словарь с шаблонами SQL запросов и порядком колонок
+        """
+        column_names = ("id", *field_names)
+        columns = ", ".join(column_names)
+        placeholders = ", ".join("?" for _ in field_names)
+        set_clause = ", ".join(f"{name} = ?" for name in field_names)
+
+        return {
+            "insert": f"INSERT INTO {table_name} ({', '.join(field_names)}) VALUES ({placeholders})",
+            "update": f"UPDATE {table_name} SET {set_clause} WHERE id = ?",
+            "select_by_id": f"SELECT {columns} FROM {table_name} WHERE id = ?",
+            "select_all": f"SELECT {columns} FROM {table_name}",
+            "delete": f"DELETE FROM {table_name} WHERE id = ?",
+            "indexes": tuple(
+                f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{name} ON {table_name} ({name})" for name in indexes
+            ),
+            "field_names": field_names,
+            "column_names": column_names,
+        }
+
 
 class Model(metaclass=ModelMeta):
     """Базовый класс для всех моделей ORM."""
@@ -86,11 +226,18 @@ class Model(metaclass=ModelMeta):
     # Глобальное подключение к базе данных (настраивается через configure_db)
     _db: ClassVar[DatabaseConnection | None] = None
 
+    # Количество id в одном DELETE ... WHERE id IN (...) (лимит параметров SQLite - 999 в старых версиях)
+    _bulk_delete_chunk_size: ClassVar[int] = 500
+
     class Meta:
         """Конфигурация модели."""
 
         abstract: bool = False
         db_table: str | None = None
+        # Поля, по которым создаются индексы (ускоряют filter() по этим полям)
+        indexes: tuple[str, ...] = ()
+        # Размер кеша get() по id (0 - отключить). Изменения в обход ORM кеш не отслеживает
+        cache_size: int = 1024
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Инициализация экземпляра модели."""
@@ -147,17 +294,51 @@ class Model(metaclass=ModelMeta):
         return cls._meta.get("abstract", False)
 
     @classmethod
-    def configure_db(cls, database_path: str | Path, check_same_thread: bool = False, **kwargs: Any) -> None:
+    def configure_db(
+        cls,
+        database_path: str | Path,
+        check_same_thread: bool = False,
+        auto_create: bool = True,
+        **kwargs: Any,
+    ) -> None:
         """
         Настраивает глобальное подключение к базе данных для всех моделей.
 
+        Операции чтения (get, all, filter, values) не проверяют существование таблицы, поэтому таблицы
+        создаются здесь. Для моделей, объявленных после configure_db, нужно вызвать create_table().
+
         Args:
             database_path: Путь к файлу базы данных SQLite
             check_same_thread: Разрешить использование в разных потоках
-            **kwargs: Дополнительные параметры для sqlite3.connect()
+            auto_create: Создать таблицы всех объявленных неабстрактных моделей одной транзакцией
+            **kwargs: Настройки PRAGMA (journal_mode, synchronous и т.д.) и параметры для sqlite3.connect()
         """
+        # Предыдущее подключение закрывается: в режиме WAL оно удерживает файлы -wal/-shm и общую память
+        if cls._db is not None:
+            cls._db.close()
+
         cls._db = DatabaseConnection(database_path, check_same_thread=check_same_thread, **kwargs)
 
+        # Новая БД: сведения о созданных таблицах и кешированные строки больше не актуальны
+        for model in cls._iter_models():
+            model._meta["_table_ready"] = False
+            model._invalidate_cache()
+
+        if auto_create:
+            with cls._db.atomic():
+                for model in cls._iter_models():
+                    # Сам Model не описывает таблицу
+                    if model is not Model:
+                        model.create_table()
+
+    @classmethod
+    def _iter_models(cls) -> Iterator[type["Model"]]:
+        """Обходит модель и всех её наследников, у которых есть собственные метаданные."""
+        if "_meta" in cls.__dict__:
+            yield cls
+        for subclass in cls.__subclasses__():
+            yield from subclass._iter_models()
+
     @classmethod
     def _ensure_db_connection(cls) -> DatabaseConnection:
         """Проверяет наличие подключения к БД и возвращает его."""
@@ -167,6 +348,21 @@ class Model(metaclass=ModelMeta):
             )
         return cls._db
 
+    @classmethod
+    def transaction(cls) -> AbstractContextManager[DatabaseConnection]:
+        """
+        Возвращает контекстный менеджер транзакции для группировки операций.
+
+        Внутри блока save(), create() и delete() не выполняют commit после каждой операции.
+        Записи из других потоков ждут завершения блока.
+
+        Examples:
+            >>> with Model.transaction():
+            ...     for user in users:
+            ...         user.save()
+        """
+        return cls._ensure_db_connection().atomic()
+
     @classmethod
     def _table_exists(cls, db: DatabaseConnection, table_name: str) -> bool:
         """Проверяет существование таблицы в базе данных."""
@@ -190,15 +386,14 @@ class Model(metaclass=ModelMeta):
         if cls.is_abstract():
             raise RuntimeError(f"Cannot create table for abstract model {cls.__name__}")
 
-        table_name = cls.get_table_name()
-        fields = cls.get_fields()
+        table_name = cls._meta["table_name"]
+        field_names, sqlite_types, _ = cls._meta["cols"]
 
         # Начинаем с поля id
         columns = ["id INTEGER PRIMARY KEY AUTOINCREMENT"]
 
         # Добавляем поля из аннотаций
-        for field_name, field_meta in fields.items():
-            sqlite_type = field_meta["sqlite_type"]
+        for field_name, sqlite_type in zip(field_names, sqlite_types, strict=True):
             columns.append(f"{field_name} {sqlite_type}")
 
         # Создаем SQL запрос
@@ -207,7 +402,7 @@ class Model(metaclass=ModelMeta):
     @classmethod
     def create_table(cls, check_if_exists: bool = True) -> None:
         """
-        Создает таблицу для модели в базе данных.
+        Создает таблицу и индексы из Meta.indexes для модели в базе данных.
 
         Args:
             check_if_exists: Проверять существование таблицы перед созданием
@@ -219,19 +414,22 @@ class Model(metaclass=ModelMeta):
             raise RuntimeError(f"Cannot create table for abstract model {cls.__name__}")
 
         db = cls._ensure_db_connection()
-        table_name = cls.get_table_name()
+        table_name = cls._meta["table_name"]
 
-        if check_if_exists and cls._table_exists(db, table_name):
-            return
+        with db.atomic():
+            if not (check_if_exists and cls._table_exists(db, table_name)):
+                db.execute(cls._create_table_sql())
+
+            # Индексы создаются и для уже существующей таблицы, если они были добавлены в Meta позже
+            for index_sql in cls._meta["sql"]["indexes"]:
+                db.execute(index_sql)
 
-        sql = cls._create_table_sql()
-        db.execute(sql)
-        db.commit()
+        cls._meta["_table_ready"] = True
 
     @classmethod
     def _ensure_table(cls) -> None:
         """Проверяет существование таблицы и создает её при необходимости."""
-        if cls.is_abstract():
+        if cls._meta["_table_ready"] or cls.is_abstract():
             return
 
         cls.create_table(check_if_exists=True)
@@ -241,39 +439,36 @@ class Model(metaclass=ModelMeta):
         if hasattr(self, "validate") and callable(self.validate):
             self.validate()
 
-    def _to_db_dict(self) -> dict[str, Any]:
-        """Преобразует экземпляр модели в словарь для сохранения в БД."""
-        if not hasattr(self, "_meta"):
-            raise RuntimeError(f"Model {self.__class__.__name__} is abstract or not properly initialized")
+    def _to_db_tuple(self) -> tuple[Any, ...]:
+        """Преобразует экземпляр модели в кортеж значений для БД в порядке колонок _meta["cols"] (без id)."""
+        field_names = self._meta["cols"][0]
+        return tuple(getattr(self, field_name, None) for field_name in field_names)
 
-        db_dict: dict[str, Any] = {}
-        fields = self.get_fields()
-
-        for field_name, field_meta in fields.items():
-            value = getattr(self, field_name, None)
-            annotation = field_meta["annotation"]
-            db_dict[field_name] = to_db_value(value, annotation)
+    @classmethod
+    def _from_db_row(cls, row: tuple[Any, ...]) -> "Model":
+        """
+        Создает экземпляр модели из строки результата БД.
 
-        return db_dict
+        Колонки строки должны идти в порядке _meta["sql"]["column_names"]. Для моделей со сгенерированным
+        __init__ значения записываются напрямую в __dict__ экземпляра; пользовательский __init__ вызывается.
+        """
+        field_names, _, from_db = cls._meta["cols"]
+        generated_init = cls._meta["generated_init"]
 
-    @classmethod
-    def _from_db_row(cls, row: tuple[Any, ...], column_names: list[str]) -> "Model":
-        """Создает экземпляр модели из строки результата БД."""
-        if not hasattr(cls, "_meta"):
-            raise RuntimeError(f"Model {cls.__name__} is abstract or not properly initialized")
+        if generated_init:
+            instance = cls.__new__(cls)
+            data = instance.__dict__
+        else:
+            data = {}
 
-        fields = cls.get_fields()
-        data: dict[str, Any] = {}
+        for field_name, converter, value in zip(field_names, from_db, row[1:], strict=True):
+            data[field_name] = value if converter is None or value is None else converter(value)
 
-        for i, column_name in enumerate(column_names):
-            if column_name == "id":
-                data["id"] = row[i]
-            elif column_name in fields:
-                field_meta = fields[column_name]
-                annotation = field_meta["annotation"]
-                data[column_name] = from_db_value(row[i], annotation)
+        if not generated_init:
+            return cls(id=row[0], **data)
 
-        return cls(**data)
+        data["id"] = row[0]
+        return instance
 
     @classmethod
     def create(cls, **kwargs: Any) -> "Model":
@@ -298,22 +493,57 @@ class Model(metaclass=ModelMeta):
         instance._ensure_table()
 
         db = cls._ensure_db_connection()
-        table_name = cls.get_table_name()
 
-        db_dict = instance._to_db_dict()
-        field_names = list(db_dict.keys())
-        placeholders = ", ".join(["?" for _ in field_names])
-        columns = ", ".join(field_names)
-
-        sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-        values = tuple(db_dict.values())
-
-        cursor = db.execute(sql, values)
-        db.commit()
+        values = instance._to_db_tuple()
+        with db.atomic():
+            cursor = db.execute(cls._meta["sql"]["insert"], values)
 
         instance.id = cursor.lastrowid
         return instance
 
+    @classmethod
+    def bulk_create(cls, instances: list["Model"]) -> list["Model"]:
+        """
+        Создает множество записей одним запросом executemany в рамках одной транзакции.
+
+        Args:
+            instances: Экземпляры модели без id
+
+        Returns:
+            Те же экземпляры с установленными id
+
+        Raises:
+            RuntimeError: Если модель абстрактная, подключение не настроено или у экземпляра уже есть id
+            ValueError: Если валидация не прошла
+        """
+        if cls.is_abstract():
+            raise RuntimeError(f"Cannot create instances of abstract model {cls.__name__}")
+
+        if not instances:
+            return instances
+
+        for instance in instances:
+            if instance.id is not None:
+                raise RuntimeError("Cannot bulk create instance that already has an id")
+            instance._validate()
+
+        cls._ensure_table()
+
+        db = cls._ensure_db_connection()
+
+        values = [instance._to_db_tuple() for instance in instances]
+        with db.atomic():
+            db.executemany(cls._meta["sql"]["insert"], values)
+            # executemany не заполняет lastrowid, поэтому берем id последней вставленной строки
+            last_id = db.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        # AUTOINCREMENT выдает id подряд внутри одной транзакции
+        first_id = last_id - len(instances) + 1
+        for offset, instance in enumerate(instances):
+            instance.id = first_id + offset
+
+        return instances
+
     def save(self) -> int | None:
         """
         Сохраняет или обновляет запись в базе данных.
@@ -332,32 +562,54 @@ class Model(metaclass=ModelMeta):
         self.__class__._ensure_table()
 
         db = self.__class__._ensure_db_connection()
-        table_name = self.__class__.get_table_name()
+        sql = self._meta["sql"]
 
-        db_dict = self._to_db_dict()
+        values = self._to_db_tuple()
 
         if self.id is None:
-            field_names = list(db_dict.keys())
-            placeholders = ", ".join(["?" for _ in field_names])
-            columns = ", ".join(field_names)
-
-            sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-            values = tuple(db_dict.values())
-
-            cursor = db.execute(sql, values)
-            db.commit()
+            with db.atomic():
+                cursor = db.execute(sql["insert"], values)
             self.id = cursor.lastrowid
         else:
-            field_names = list(db_dict.keys())
-            set_clause = ", ".join([f"{name} = ?" for name in field_names])
-            sql = f"UPDATE {table_name} SET {set_clause} WHERE id = ?"
-            values = (*tuple(db_dict.values()), self.id)
-
-            db.execute(sql, values)
-            db.commit()
+            with db.atomic():
+                db.execute(sql["update"], (*values, self.id))
+            self._invalidate_cache((self.id,))
 
         return self.id
 
+    @classmethod
+    def bulk_update(cls, instances: list["Model"]) -> None:
+        """
+        Обновляет множество записей одним запросом executemany в рамках одной транзакции.
+
+        Args:
+            instances: Экземпляры модели с установленным id
+
+        Raises:
+            RuntimeError: Если модель абстрактная, подключение не настроено или у экземпляра нет id
+            ValueError: Если валидация не прошла
+        """
+        if cls.is_abstract():
+            raise RuntimeError(f"Cannot update instances of abstract model {cls.__name__}")
+
+        if not instances:
+            return
+
+        for instance in instances:
+            if instance.id is None:
+                raise RuntimeError("Cannot update instance without id")
+            instance._validate()
+
+        cls._ensure_table()
+
+        db = cls._ensure_db_connection()
+
+        values = [(*instance._to_db_tuple(), instance.id) for instance in instances]
+        with db.atomic():
+            db.executemany(cls._meta["sql"]["update"], values)
+
+        cls._invalidate_cache(instance.id for instance in instances)
+
     def delete(self) -> None:
         """
         Удаляет запись из базы данных.
@@ -372,14 +624,50 @@ class Model(metaclass=ModelMeta):
             raise RuntimeError("Cannot delete instance without id")
 
         db = self.__class__._ensure_db_connection()
-        table_name = self.__class__.get_table_name()
 
-        sql = f"DELETE FROM {table_name} WHERE id = ?"
-        db.execute(sql, (self.id,))
-        db.commit()
+        with db.atomic():
+            db.execute(self._meta["sql"]["delete"], (self.id,))
+        self._invalidate_cache((self.id,))
 
         self.id = None
 
+    @classmethod
+    def bulk_delete(cls, ids: Iterable[int]) -> int:
+        """
+        Удаляет записи по списку id запросами WHERE id IN (...) в рамках одной транзакции.
+
+        Args:
+            ids: Идентификаторы удаляемых записей
+
+        Returns:
+            Количество удаленных записей
+
+        Raises:
+            RuntimeError: Если модель абстрактная или подключение не настроено
+        """
+        if cls.is_abstract():
+            raise RuntimeError(f"Cannot delete instances of abstract model {cls.__name__}")
+
+        ids = list(ids)
+        if not ids:
+            return 0
+
+        db = cls._ensure_db_connection()
+        table_name = cls._meta["table_name"]
+        chunk_size = cls._bulk_delete_chunk_size
+        deleted = 0
+
+        with db.atomic():
+            for start in range(0, len(ids), chunk_size):
+                chunk = tuple(ids[start : start + chunk_size])
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = db.execute(f"DELETE FROM {table_name} WHERE id IN ({placeholders})", chunk)
+                deleted += cursor.rowcount
+
+        cls._invalidate_cache(ids)
+
+        return deleted
+
     @classmethod
     def get(cls, id: int) -> "Model | None":
         """
@@ -397,23 +685,72 @@ class Model(metaclass=ModelMeta):
         if cls.is_abstract():
             raise RuntimeError(f"Cannot get instance of abstract model {cls.__name__}")
 
-        cls._ensure_table()
-
-        db = cls._ensure_db_connection()
-        table_name = cls.get_table_name()
-        fields = cls.get_fields()
+        meta = cls._meta
+        cache = meta["_get_cache"]
+        rows = cache["rows"]
+        with cache["lock"]:
+            row = rows.get(id)
+            if row is not None:
+                rows.move_to_end(id)
+            # Поколение запоминается до запроса: инвалидация во время чтения отменит кеширование
+            generation = cache["generation"]
 
-        column_names = ["id", *list(fields.keys())]
-        columns = ", ".join(column_names)
+        if row is not None:
+            return cls._from_db_row(row)
 
-        sql = f"SELECT {columns} FROM {table_name} WHERE id = ?"
-        cursor = db.execute(sql, (id,))
+        db = cls._ensure_db_connection()
+        # Запрос может увидеть незафиксированную запись другого потока; откат этой транзакции
+        # увеличит счетчик подключения и тоже отменит кеширование
+        snapshot = (generation, db.rollback_count)
+        cursor = db.execute(meta["sql"]["select_by_id"], (id,))
         row = cursor.fetchone()
 
         if row is None:
             return None
 
-        return cls._from_db_row(row, column_names)
+        cls._cache_row(db, row, snapshot)
+        return cls._from_db_row(row)
+
+    @classmethod
+    def _cache_row(cls, db: DatabaseConnection, row: tuple[Any, ...], snapshot: tuple[int, int]) -> None:
+        """
+        Кладет строку в кеш get(), если он включен и строка все еще актуальна.
+
+        Строка не кешируется, если в подключении есть незафиксированные изменения или если после её чтения
+        кеш был инвалидирован либо транзакция откачена (snapshot - поколение кеша и счетчик откатов до запроса).
+        """
+        meta = cls._meta
+        cache_size = meta["cache_size"]
+        if not cache_size or db.connection.in_transaction:
+            return
+
+        cache = meta["_get_cache"]
+        rows = cache["rows"]
+        with cache["lock"]:
+            if (cache["generation"], db.rollback_count) != snapshot:
+                return
+
+            rows[row[0]] = row
+            if len(rows) > cache_size:
+                rows.popitem(last=False)
+
+    @classmethod
+    def _invalidate_cache(cls, ids: Iterable[int] | None = None) -> None:
+        """
+        Удаляет строки из кеша get() таблицы модели и увеличивает поколение кеша.
+
+        Args:
+            ids: Идентификаторы измененных записей; None очищает кеш целиком
+        """
+        cache = cls._meta["_get_cache"]
+        rows = cache["rows"]
+        with cache["lock"]:
+            cache["generation"] += 1
+            if ids is None:
+                rows.clear()
+            else:
+                for id in ids:
+                    rows.pop(id, None)
 
     @classmethod
     def all(cls) -> list["Model"]:
@@ -426,23 +763,31 @@ class Model(metaclass=ModelMeta):
         Raises:
             RuntimeError: Если модель абстрактная или подключение не настроено
         """
-        if cls.is_abstract():
-            raise RuntimeError(f"Cannot get instances of abstract model {cls.__name__}")
+        return list(cls.iter_all())
 
-        cls._ensure_table()
+    @classmethod
+    def iter_all(cls) -> Iterator["Model"]:
+        """
+        Последовательно читает все записи из таблицы, не загружая их в память целиком.
 
-        db = cls._ensure_db_connection()
-        table_name = cls.get_table_name()
-        fields = cls.get_fields()
+        Returns:
+            Итератор экземпляров модели
 
-        column_names = ["id", *list(fields.keys())]
-        columns = ", ".join(column_names)
+        Raises:
+            RuntimeError: Если модель абстрактная или подключение не настроено
+
+        Examples:
+            >>> for user in User.iter_all():
+            ...     if user.age > 18:
+            ...         break
+        """
+        if cls.is_abstract():
+            raise RuntimeError(f"Cannot get instances of abstract model {cls.__name__}")
 
-        sql = f"SELECT {columns} FROM {table_name}"
-        cursor = db.execute(sql)
-        rows = cursor.fetchall()
+        db = cls._ensure_db_connection()
+        cursor = db.execute(cls._meta["sql"]["select_all"])
 
-        return [cls._from_db_row(row, column_names) for row in rows]
+        return (cls._from_db_row(row) for row in cursor)
 
     @classmethod
     def filter(cls, **kwargs: Any) -> list["Model"]:
@@ -464,36 +809,89 @@ class Model(metaclass=ModelMeta):
 
         Raises:
             RuntimeError: Если модель абстрактная или подключение не настроено
-            ValueError: Если указан неподдерживаемый оператор фильтрации
+            ValueError: Если указано несуществующее поле
 
         Examples:
             >>> User.filter(age__gt=18, is_active=True)
             >>> User.filter(name__like='%John%')
             >>> User.filter(email__exact='john@example.com')
         """
+        return list(cls.iter_filter(**kwargs))
+
+    @classmethod
+    def iter_filter(cls, **kwargs: Any) -> Iterator["Model"]:
+        """
+        Последовательно читает записи, соответствующие условиям, не загружая их в память целиком.
+
+        Args:
+            **kwargs: Условия фильтрации в том же формате, что и для filter()
+
+        Returns:
+            Итератор экземпляров модели, соответствующих условиям
+
+        Raises:
+            RuntimeError: Если модель абстрактная или подключение не настроено
+            ValueError: Если указано несуществующее поле
+        """
         if cls.is_abstract():
             raise RuntimeError(f"Cannot filter instances of abstract model {cls.__name__}")
 
-        cls._ensure_table()
-
         db = cls._ensure_db_connection()
-        table_name = cls.get_table_name()
-        fields = cls.get_fields()
+        where_clause, values = QueryBuilder.parse_filters(cls._meta["fields"], cls.__name__, **kwargs)
 
-        # Валидация полей в фильтрах
-        where_clause, values = QueryBuilder.parse_filters(**kwargs)
+        cursor = db.execute(f"{cls._meta['sql']['select_all']} WHERE {where_clause}", values)
 
-        # Проверяем, что все поля в фильтрах существуют
-        for key in kwargs:
-            field_name, _ = QueryBuilder.parse_filter_key(key)
-            if field_name not in fields and field_name != "id":
+        return (cls._from_db_row(row) for row in cursor)
+
+    @classmethod
+    def values(cls, *field_names: str, **kwargs: Any) -> list[tuple[Any, ...]]:
+        """
+        Получает только указанные колонки записей в виде кортежей, без создания экземпляров модели.
+
+        Args:
+            *field_names: Имена колонок (id или поля модели); по умолчанию все колонки
+            **kwargs: Условия фильтрации в том же формате, что и для filter()
+
+        Returns:
+            Список кортежей со значениями колонок в порядке field_names
+
+        Raises:
+            RuntimeError: Если модель абстрактная или подключение не настроено
+            ValueError: Если указано несуществующее поле
+
+        Examples:
+            >>> User.values("id", "name", age__gt=18)
+        """
+        if cls.is_abstract():
+            raise RuntimeError(f"Cannot get values of abstract model {cls.__name__}")
+
+        fields = cls._meta["fields"]
+        if not field_names:
+            field_names = cls._meta["sql"]["column_names"]
+
+        converters = []
+        for field_name in field_names:
+            if field_name == "id":
+                converters.append(None)
+            elif field_name in fields:
+                converters.append(fields[field_name]["from_db"])
+            else:
                 raise ValueError(f"Field '{field_name}' does not exist in model {cls.__name__}")
 
-        column_names = ["id", *list(fields.keys())]
-        columns = ", ".join(column_names)
+        db = cls._ensure_db_connection()
+        where_clause, values = QueryBuilder.parse_filters(cls._meta["fields"], cls.__name__, **kwargs)
 
-        sql = f"SELECT {columns} FROM {table_name} WHERE {where_clause}"
-        cursor = db.execute(sql, tuple(values))
-        rows = cursor.fetchall()
+        sql = f"SELECT {', '.join(field_names)} FROM {cls._meta['table_name']} WHERE {where_clause}"
+        rows = db.execute(sql, values).fetchall()
 
-        return [cls._from_db_row(row, column_names) for row in rows]
+        # Без преобразователей строки БД уже имеют нужный вид
+        if not any(converters):
+            return rows
+
+        return [
+            tuple(
+                value if converter is None or value is None else converter(value)
+                for converter, value in zip(converters, row, strict=True)
+            )
+            for row in rows
+        ]
@@ -1,5 +1,8 @@
 import sqlite3
+import threading
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -7,19 +10,49 @@ from typing import Any
 class DatabaseConnection:
     """Синхронное подключение к SQLite базе данных."""
 
-    def __init__(self, database_path: str | Path, check_same_thread: bool = False, **kwargs: Any):
+    def __init__(
+        self,
+        database_path: str | Path,
+        check_same_thread: bool = False,
+        journal_mode: str | None = "WAL",
+        synchronous: str | None = "NORMAL",
+        temp_store: str | None = "MEMORY",
+        cache_size: int | None = -64000,
+        mmap_size: int | None = 268435456,
+        **kwargs: Any,
+    ):
         """
         Инициализация синхронного подключения к базе данных.
 
+        Значения PRAGMA применяются при открытии подключения; None оставляет значение SQLite по умолчанию.
+
         Args:
             database_path: Путь к файлу базы данных SQLite
             check_same_thread: Разрешить использование в разных потоках
+            journal_mode: PRAGMA journal_mode (WAL убирает fsync из каждого commit)
+            synchronous: PRAGMA synchronous
+            temp_store: PRAGMA temp_store
+            cache_size: PRAGMA cache_size (отрицательное значение задает размер в КиБ)
+            mmap_size: PRAGMA mmap_size в байтах
             **kwargs: Дополнительные параметры для sqlite3.connect()
         """
         self.database_path = Path(database_path)
         self.check_same_thread = check_same_thread
         self.connection: sqlite3.Connection | None = None
+        self.pragmas: dict[str, str | int | None] = {
+            "journal_mode": journal_mode,
+            "synchronous": synchronous,
+            "temp_store": temp_store,
+            "cache_size": cache_size,
+            "mmap_size": mmap_size,
+        }
         self.kwargs = kwargs
+        # Все потоки делят одно подключение, а значит и одну транзакцию: глубина atomic() хранится
+        # на подключении, а блок atomic() удерживает блокировку, пока транзакция не завершится
+        self._atomic_depth = 0
+        self._atomic_lock = threading.RLock()
+        # Количество откатов транзакций: кеши чтения сверяют его, чтобы не сохранить откаченные данные
+        self.rollback_count = 0
 
     def connect(self) -> sqlite3.Connection:
         """Открывает подключение к базе данных."""
@@ -27,14 +60,29 @@ class DatabaseConnection:
             self.connection = sqlite3.connect(
                 str(self.database_path), check_same_thread=self.check_same_thread, **self.kwargs
             )
+            self._apply_pragmas(self.connection)
+
+            # Дальше запросы идут напрямую в sqlite3.Connection, минуя проверку подключения
+            self.execute = self.connection.execute
+            self.executemany = self.connection.executemany
         return self.connection
 
+    def _apply_pragmas(self, connection: sqlite3.Connection) -> None:
+        """Применяет настройки PRAGMA к только что открытому подключению."""
+        for name, value in self.pragmas.items():
+            if value is not None:
+                connection.execute(f"PRAGMA {name}={value}")
+
     def close(self) -> None:
         """Закрывает подключение к базе данных."""
         if self.connection is not None:
             self.connection.close()
             self.connection = None
 
+            # Возвращаем методы класса, которые откроют подключение при следующем запросе
+            del self.execute
+            del self.executemany
+
     def commit(self) -> None:
         if self.connection is None:
             raise RuntimeError("Connection is not open")
@@ -44,11 +92,52 @@ class DatabaseConnection:
         if self.connection is None:
             raise RuntimeError("Connection is not open")
         self.connection.rollback()
+        self.rollback_count += 1
+
+    @property
+    def in_atomic_block(self) -> bool:
+        """Возвращает True, если на подключении открыт блок atomic()."""
+        return self._atomic_depth > 0
 
-    def execute(self, query: str, parameters: tuple | dict | None = None) -> sqlite3.Cursor:
+    @contextmanager
+    def atomic(self) -> Iterator["DatabaseConnection"]:
+        """
+        Объединяет операции в одну транзакцию: commit при успехе, rollback при исключении.
+
+        Вложенные блоки присоединяются к внешней транзакции. Пока блок открыт, atomic() из других потоков
+        ждет его завершения, поэтому чужие операции не попадают в незавершенную транзакцию.
+
+        Examples:
+            >>> with db.atomic():
+            ...     for user in users:
+            ...         user.save()
+        """
+        with self._atomic_lock:
+            connection = self.connect()
+            depth = self._atomic_depth
+
+            if depth == 0 and not connection.in_transaction:
+                connection.execute("BEGIN")
+
+            self._atomic_depth = depth + 1
+            try:
+                yield self
+            except BaseException:
+                if depth == 0:
+                    self.rollback()
+                raise
+            else:
+                if depth == 0:
+                    connection.commit()
+            finally:
+                self._atomic_depth = depth
+
+    def execute(self, query: str, parameters: tuple | dict = ()) -> sqlite3.Cursor:
         """
         Выполняет SQL запрос.
 
+        После connect() заменяется на sqlite3.Connection.execute.
+
         Args:
             query: SQL запрос
             parameters: Параметры запроса
@@ -58,12 +147,14 @@ class DatabaseConnection:
         """
         if self.connection is None:
             self.connect()
-        return self.connection.execute(query, parameters or ())
+        return self.connection.execute(query, parameters)
 
     def executemany(self, query: str, parameters: list[tuple | dict]) -> sqlite3.Cursor:
         """
         Выполняет SQL запрос с множеством параметров.
 
+        После connect() заменяется на sqlite3.Connection.executemany.
+
         Args:
             query: SQL запрос
             parameters: Список параметров запроса
@@ -11,7 +11,7 @@ class FieldType:
             return None
 
         if self.python_type is bool:
-            return 1 if value else 0
+            return int(bool(value))
 
         return value
 
@@ -33,6 +33,34 @@ TYPE_MAPPING = {
     bool: FieldType("INTEGER", bool),
 }
 
+# Строковые аннотации поддерживаемых типов, которые разрешаются без eval
+ANNOTATION_ALIASES: dict[str, Any] = {
+    **{python_type.__name__: python_type for python_type in TYPE_MAPPING},
+    **{f"{python_type.__name__} | None": python_type | None for python_type in TYPE_MAPPING},
+}
+
+
+def resolve_annotation(annotation: Any, globalns: dict[str, Any] | None = None, localns: Any = None) -> Any:
+    """
+    Разрешает строковую аннотацию (forward reference) в объект типа.
+
+    Args:
+        annotation: Аннотация типа из класса (объект или строка)
+        globalns: Глобальное пространство имен модуля, в котором объявлен класс
+        localns: Локальное пространство имен (атрибуты класса)
+
+    Returns:
+        Аннотация в виде объекта типа
+    """
+    if not isinstance(annotation, str):
+        return annotation
+
+    resolved = ANNOTATION_ALIASES.get(annotation)
+    if resolved is not None:
+        return resolved
+
+    return eval(annotation, globalns, localns)
+
 
 def get_field_type(annotation: Any) -> FieldType | None:
     """
@@ -1,3 +1,6 @@
+import functools
+
+from collections.abc import Container
 from typing import Any, ClassVar
 
 
@@ -13,42 +16,63 @@ class QueryBuilder:
     }
 
     @classmethod
-    def parse_filters(cls, **kwargs: Any) -> tuple[str, list[Any]]:
+    def parse_filters(cls, allowed_fields: Container[str], model_name: str, /, **kwargs: Any) -> tuple[str, list[Any]]:
         """
         Парсит фильтры из kwargs и возвращает SQL WHERE clause и список значений.
 
         Args:
+            allowed_fields: Имена полей модели, по которым разрешена фильтрация (id разрешен всегда)
+            model_name: Имя модели для сообщения об ошибке
             **kwargs: Фильтры в формате field__operator=value или field=value
 
         Returns:
             Кортеж (WHERE clause, список значений для подстановки)
 
+        Raises:
+            ValueError: Если поле не входит в allowed_fields
+
         Examples:
-            >>> QueryBuilder.parse_filters(age__gt=18, name__exact='John')
+            >>> QueryBuilder.parse_filters({"age", "name"}, "User", age__gt=18, name__exact='John')
             ('age > ? AND name = ?', [18, 'John'])
 
-            >>> QueryBuilder.parse_filters(name='John')
+            >>> QueryBuilder.parse_filters({"name"}, "User", name='John')
             ('name = ?', ['John'])
         """
-        conditions: list[str] = []
-        values: list[Any] = []
+        conditions = [cls.build_condition(key) for key in kwargs]
 
-        for key, value in kwargs.items():
-            field_name, operator = cls.parse_filter_key(key)
+        for field_name, _ in conditions:
+            if field_name not in allowed_fields and field_name != "id":
+                raise ValueError(f"Field '{field_name}' does not exist in model {model_name}")
 
-            if operator not in cls.OPERATORS:
-                raise ValueError(f"Unsupported filter operator: {operator}")
+        where_clause = " AND ".join(condition for _, condition in conditions) if conditions else "1=1"
 
-            sql_operator = cls.OPERATORS[operator]
-            conditions.append(f"{field_name} {sql_operator} ?")
-            values.append(value)
+        return where_clause, list(kwargs.values())
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def build_condition(key: str) -> tuple[str, str]:
+        """
+        Строит SQL условие для ключа фильтра.
 
-        return where_clause, values
+        Результат кешируется: набор ключей фильтров в приложении обычно невелик.
 
-    @classmethod
-    def parse_filter_key(cls, key: str) -> tuple[str, str]:
+        Args:
+            key: Ключ фильтра (например, "age__gt" или "name")
+
+        Returns:
+            Кортеж (имя поля, SQL условие с плейсхолдером)
+
+        Examples:
+            >>> QueryBuilder.build_condition("age__gt")
+            ('age', 'age > ?')
+        """
+        # parse_filter_key всегда возвращает оператор из OPERATORS: ключ с неизвестным суффиксом
+        # целиком считается именем поля и отклоняется проверкой полей в parse_filters
+        field_name, operator = QueryBuilder.parse_filter_key(key)
+        return field_name, f"{field_name} {QueryBuilder.OPERATORS[operator]} ?"
+
+    @staticmethod
+    def parse_filter_key(key: str) -> tuple[str, str]:
         """
         Парсит ключ фильтра и извлекает имя поля и оператор.
 
@@ -65,16 +89,9 @@ class QueryBuilder:
             >>> QueryBuilder.parse_filter_key("name")
             ('name', '__exact')
         """
-        if "__" not in key:
-            return key, "__exact"
-
-        parts = key.rsplit("__", 1)
-
-        if len(parts) == 2:
-            field_name, operator = parts
-            operator = f"__{operator}"
-
-            if operator in cls.OPERATORS:
-                return field_name, operator
+        # Операторы - фиксированные суффиксы, поэтому достаточно endswith без разбиения строки
+        for operator in QueryBuilder.OPERATORS:
+            if key.endswith(operator):
+                return key[: -len(operator)], operator
 
         return key, "__exact"